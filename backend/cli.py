@@ -5,13 +5,13 @@ import argparse
 import sys
 from datetime import date, datetime, timezone
 
-from core.calendar import ZODIAC_SIGNS, ZodiacDate, format_amareth_year, from_amareth
+from core.calendar import ZODIAC_SIGNS, format_amareth_year, from_amareth
 from core.converter import (
     gregorian_to_zodiac,
+    month_days,
     month_length,
     today_zodiac,
     year_length,
-    zodiac_to_gregorian,
 )
 from core.ephemeris import get_ingresses_for_year
 
@@ -37,24 +37,28 @@ def cmd_year(args):
     """Show all months of an Amaréth year."""
     year = from_amareth(args.year)
     ingresses = get_ingresses_for_year(year)
+    next_aries = get_ingresses_for_year(year + 1)[0]
+    starts = [ing["utc_datetime"].date() for ing in ingresses] + [next_aries["utc_datetime"].date()]
 
-    print(f"\n  Amareth Calendar - {format_amareth_year(year)}")
-    print(f"  {'=' * 55}")
-    print(f"  {'Nr':>3}  {'Miesiac':<14} {'Symbol':>6}  {'Rozpoczecie':>20}  {'Dni':>4}")
-    print(f"  {'-' * 55}")
+    lines = []
+    lines.append(f"\n  Amareth Calendar - {format_amareth_year(year)}")
+    lines.append(f"  {'=' * 55}")
+    lines.append(f"  {'Nr':>3}  {'Miesiac':<14} {'Symbol':>6}  {'Rozpoczecie':>20}  {'Dni':>4}")
+    lines.append(f"  {'-' * 55}")
 
     total_days = 0
     for i, ing in enumerate(ingresses):
         sign = ZODIAC_SIGNS[ing["sign_index"]]
-        days = month_length(year, i + 1)
+        days = (starts[i + 1] - starts[i]).days
         total_days += days
-        dt = datetime.fromisoformat(ing["utc_iso"])
+        dt = ing["utc_datetime"]
         date_str = dt.strftime("%d %b %Y %H:%M UTC")
-        print(f"  {i+1:>3}  {sign['name']:<14} {sign['symbol']:>6}  {date_str:>20}  {days:>4}")
+        lines.append(f"  {i+1:>3}  {sign['name']:<14} {sign['symbol']:>6}  {date_str:>20}  {days:>4}")
 
-    print(f"  {'-' * 55}")
-    print(f"  {'Suma dni w roku:':<40} {total_days:>4}")
-    print()
+    lines.append(f"  {'-' * 55}")
+    lines.append(f"  {'Suma dni w roku:':<40} {total_days:>4}")
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_month(args):
@@ -64,16 +68,16 @@ def cmd_month(args):
     days = month_length(year, month)
     sign = ZODIAC_SIGNS[month - 1]
 
-    print(f"\n  {sign['symbol']} {sign['name']} ({sign['latin']}), {format_amareth_year(year)}")
-    print(f"  Dlugosc: {days} dni")
-    print(f"  Dlugosc ekliptyczna: {sign['longitude_start']}deg - {sign['longitude_start'] + 30}deg")
-    print()
+    lines = []
+    lines.append(f"\n  {sign['symbol']} {sign['name']} ({sign['latin']}), {format_amareth_year(year)}")
+    lines.append(f"  Dlugosc: {days} dni")
+    lines.append(f"  Dlugosc ekliptyczna: {sign['longitude_start']}deg - {sign['longitude_start'] + 30}deg")
+    lines.append("")
 
-    for day in range(1, days + 1):
-        zd = ZodiacDate(year=year, month=month, day=day)
-        greg = zodiac_to_gregorian(zd)
-        print(f"  {day:>3} {sign['name']:<14} = {greg.isoformat()} ({greg.strftime('%A')})")
-    print()
+    for day, greg in enumerate(month_days(year, month), start=1):
+        lines.append(f"  {day:>3} {sign['name']:<14} = {greg.isoformat()} ({greg.strftime('%A')})")
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
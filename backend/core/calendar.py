@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -18,6 +19,7 @@ def from_amareth(amareth_year: int) -> int:
     return amareth_year + AMARETH_EPOCH
 
 
+@lru_cache(maxsize=512)
 def format_amareth_year(zodiac_year: int) -> str:
     """Format a zodiac year as Amaréth era string."""
     a = to_amareth(zodiac_year)
@@ -28,25 +30,30 @@ def format_amareth_year(zodiac_year: int) -> str:
     return f"Rok {abs(a)} p.A."
 
 
+# Sign fields as parallel 12-tuples, indexed by sign (0=Aries)
+_SIGN_NAMES = (
+    "Arieneum", "Taureneum", "Geminion", "Cancerion", "Leon", "Virgeon",
+    "Libreon", "Scorpion", "Sagittarion", "Caprineum", "Aquarion", "Piscion",
+)
+_SIGN_SYMBOLS = (
+    "\u2648", "\u2649", "\u264a", "\u264b", "\u264c", "\u264d",
+    "\u264e", "\u264f", "\u2650", "\u2651", "\u2652", "\u2653",
+)
+_SIGN_LATIN = (
+    "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+    "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces",
+)
+_SIGN_LON = (0, 30, 60, 90, 120, 150, 180, 210, 240, 270, 300, 330)
+
 ZODIAC_SIGNS = [
-    {"index": 0, "name": "Arieneum", "symbol": "\u2648", "latin": "Aries", "longitude_start": 0},
-    {"index": 1, "name": "Taureneum", "symbol": "\u2649", "latin": "Taurus", "longitude_start": 30},
-    {"index": 2, "name": "Geminion", "symbol": "\u264a", "latin": "Gemini", "longitude_start": 60},
-    {"index": 3, "name": "Cancerion", "symbol": "\u264b", "latin": "Cancer", "longitude_start": 90},
-    {"index": 4, "name": "Leon", "symbol": "\u264c", "latin": "Leo", "longitude_start": 120},
-    {"index": 5, "name": "Virgeon", "symbol": "\u264d", "latin": "Virgo", "longitude_start": 150},
-    {"index": 6, "name": "Libreon", "symbol": "\u264e", "latin": "Libra", "longitude_start": 180},
-    {"index": 7, "name": "Scorpion", "symbol": "\u264f", "latin": "Scorpio", "longitude_start": 210},
-    {"index": 8, "name": "Sagittarion", "symbol": "\u2650", "latin": "Sagittarius", "longitude_start": 240},
-    {"index": 9, "name": "Caprineum", "symbol": "\u2651", "latin": "Capricorn", "longitude_start": 270},
-    {"index": 10, "name": "Aquarion", "symbol": "\u2652", "latin": "Aquarius", "longitude_start": 300},
-    {"index": 11, "name": "Piscion", "symbol": "\u2653", "latin": "Pisces", "longitude_start": 330},
+    {"index": i, "name": name, "symbol": symbol, "latin": latin, "longitude_start": lon}
+    for i, (name, symbol, latin, lon) in enumerate(zip(_SIGN_NAMES, _SIGN_SYMBOLS, _SIGN_LATIN, _SIGN_LON))
 ]
 
-MONTH_NAMES = [s["name"] for s in ZODIAC_SIGNS]
+MONTH_NAMES = list(_SIGN_NAMES)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ZodiacDate:
     year: int      # Zodiac year (starts at Arieneum/Aries ingress)
     month: int     # 1-12 (1=Arieneum, 12=Piscion)
@@ -54,15 +61,15 @@ class ZodiacDate:
 
     @property
     def month_name(self) -> str:
-        return ZODIAC_SIGNS[self.month - 1]["name"]
+        return _SIGN_NAMES[self.month - 1]
 
     @property
     def sign_symbol(self) -> str:
-        return ZODIAC_SIGNS[self.month - 1]["symbol"]
+        return _SIGN_SYMBOLS[self.month - 1]
 
     @property
     def sign_latin(self) -> str:
-        return ZODIAC_SIGNS[self.month - 1]["latin"]
+        return _SIGN_LATIN[self.month - 1]
 
     @property
     def amareth_year(self) -> int:
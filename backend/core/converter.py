@@ -2,89 +2,96 @@
 
 from bisect import bisect_right
 from datetime import date, datetime, timezone
+from functools import lru_cache
 
 from .calendar import ZodiacDate
-from .ephemeris import get_ingresses_for_year
+from .ephemeris import add_cache_save_hook, get_ingress_ordinals_for_year
 
 
+@lru_cache(maxsize=256)
+def _get_ingress_ordinals_for_zodiac_year(zodiac_year: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Get ingress dates as (date ordinals, sign indices) for a zodiac year.
+
+    Same entries as `_get_ingress_dates_for_zodiac_year`, as two parallel
+    tuples with each date as `date.toordinal()`, so they can be bisected and
+    subtracted as plain ints.
+    """
+    return get_ingress_ordinals_for_year(zodiac_year)
+
+
+@lru_cache(maxsize=256)
 def _get_ingress_dates_for_zodiac_year(zodiac_year: int) -> list[tuple[date, int]]:
     """Get ingress dates as (date, sign_index) for a zodiac year.
 
     A zodiac year spans from Aries ingress of `zodiac_year` to the next Aries ingress.
     Returns 12 entries sorted by date.
     """
-    ingresses = get_ingresses_for_year(zodiac_year)
-    result = []
-    for ing in ingresses:
-        dt = datetime.fromisoformat(ing["utc_iso"]) if isinstance(ing["utc_iso"], str) else ing["utc_iso"]
-        # Use UTC date as the calendar date
-        result.append((dt.date() if hasattr(dt, 'date') else dt, ing["sign_index"]))
-    return result
+    return [
+        (date.fromordinal(ordinal), sign_index)
+        for ordinal, sign_index in zip(*_get_ingress_ordinals_for_zodiac_year(zodiac_year))
+    ]
+
 
+# A newly saved ingress table replaces whatever these memoized lookups hold
+add_cache_save_hook(_get_ingress_ordinals_for_zodiac_year.cache_clear)
+add_cache_save_hook(_get_ingress_dates_for_zodiac_year.cache_clear)
 
-def _find_zodiac_year_for_gregorian(greg_date: date) -> int:
-    """Determine which zodiac year a Gregorian date falls in.
+
+def _get_ingress_ordinals_for_gregorian(greg_date: date) -> tuple[int, tuple[int, ...], tuple[int, ...]]:
+    """Get the zodiac year a Gregorian date falls in, with that year's ingresses.
 
     The zodiac year N starts at the Aries ingress of Gregorian year N
     (around March 20). Dates before that in the same Gregorian year
-    belong to zodiac year N-1.
+    belong to zodiac year N-1. Returns (zodiac_year, ordinals, sign_indices);
+    the ingresses of year N are reused when the date falls in it.
     """
-    # Get Aries ingress for the Gregorian year
-    ingresses = get_ingresses_for_year(greg_date.year)
-    aries_ingress_iso = ingresses[0]["utc_iso"]
-    aries_date = datetime.fromisoformat(aries_ingress_iso).date()
+    zodiac_year = greg_date.year
+    ordinals, sign_indices = _get_ingress_ordinals_for_zodiac_year(zodiac_year)
 
-    if greg_date >= aries_date:
-        return greg_date.year
-    else:
-        return greg_date.year - 1
+    if greg_date.toordinal() < ordinals[0]:
+        zodiac_year -= 1
+        ordinals, sign_indices = _get_ingress_ordinals_for_zodiac_year(zodiac_year)
+
+    return zodiac_year, ordinals, sign_indices
 
 
 def gregorian_to_zodiac(greg_date: date) -> ZodiacDate:
     """Convert a Gregorian date to a Zodiac calendar date."""
-    zodiac_year = _find_zodiac_year_for_gregorian(greg_date)
-    ingress_dates = _get_ingress_dates_for_zodiac_year(zodiac_year)
-
-    dates_only = [d for d, _ in ingress_dates]
+    zodiac_year, ordinals, sign_indices = _get_ingress_ordinals_for_gregorian(greg_date)
+    greg_ord = greg_date.toordinal()
 
     # Find which month the date falls in
-    idx = bisect_right(dates_only, greg_date) - 1
+    idx = bisect_right(ordinals, greg_ord) - 1
 
     if idx < 0:
         # Before the first ingress - shouldn't happen if zodiac_year is correct
         raise ValueError(f"Date {greg_date} is before the zodiac year {zodiac_year}")
 
-    month_start_date, sign_index = ingress_dates[idx]
-    day = (greg_date - month_start_date).days + 1
-    month = sign_index + 1  # 1-based month
+    day = greg_ord - ordinals[idx] + 1
+    month = sign_indices[idx] + 1  # 1-based month
 
     return ZodiacDate(year=zodiac_year, month=month, day=day)
 
 
 def zodiac_to_gregorian(zodiac_date: ZodiacDate) -> date:
     """Convert a Zodiac calendar date to a Gregorian date."""
-    ingress_dates = _get_ingress_dates_for_zodiac_year(zodiac_date.year)
+    ordinals, _ = _get_ingress_ordinals_for_zodiac_year(zodiac_date.year)
 
     # Find the ingress for this month
     month_idx = zodiac_date.month - 1
-    if month_idx < 0 or month_idx >= len(ingress_dates):
+    if month_idx < 0 or month_idx >= len(ordinals):
         raise ValueError(f"Invalid zodiac month: {zodiac_date.month}")
 
-    month_start_date, _ = ingress_dates[month_idx]
-
-    from datetime import timedelta
-    result = month_start_date + timedelta(days=zodiac_date.day - 1)
+    result_ord = ordinals[month_idx] + zodiac_date.day - 1
 
     # Validate the day is within this month
-    if month_idx + 1 < len(ingress_dates):
-        next_month_start, _ = ingress_dates[month_idx + 1]
-        if result >= next_month_start:
-            raise ValueError(
-                f"Day {zodiac_date.day} is beyond the length of "
-                f"{zodiac_date.month_name} in zodiac year {zodiac_date.year}"
-            )
+    if month_idx + 1 < len(ordinals) and result_ord >= ordinals[month_idx + 1]:
+        raise ValueError(
+            f"Day {zodiac_date.day} is beyond the length of "
+            f"{zodiac_date.month_name} in zodiac year {zodiac_date.year}"
+        )
 
-    return result
+    return date.fromordinal(result_ord)
 
 
 def today_zodiac() -> ZodiacDate:
@@ -99,24 +106,64 @@ def month_length(zodiac_year: int, month: int) -> int:
         zodiac_year: The zodiac year.
         month: Month number (1-12).
     """
-    ingress_dates = _get_ingress_dates_for_zodiac_year(zodiac_year)
+    ordinals, _ = _get_ingress_ordinals_for_zodiac_year(zodiac_year)
     month_idx = month - 1
 
-    if month_idx < 0 or month_idx >= len(ingress_dates):
+    if month_idx < 0 or month_idx >= len(ordinals):
         raise ValueError(f"Invalid zodiac month: {month}")
 
-    start_date, _ = ingress_dates[month_idx]
+    start_ord = ordinals[month_idx]
 
-    if month_idx + 1 < len(ingress_dates):
-        end_date, _ = ingress_dates[month_idx + 1]
+    if month_idx + 1 < len(ordinals):
+        end_ord = ordinals[month_idx + 1]
     else:
         # Last month (Piscion) - ends at the Aries ingress of next year
-        next_year_ingresses = _get_ingress_dates_for_zodiac_year(zodiac_year + 1)
-        end_date, _ = next_year_ingresses[0]
+        next_year_ordinals, _ = _get_ingress_ordinals_for_zodiac_year(zodiac_year + 1)
+        end_ord = next_year_ordinals[0]
 
-    return (end_date - start_date).days
+    return end_ord - start_ord
+
+
+def month_days(zodiac_year: int, month: int) -> list[date]:
+    """Get the Gregorian date of every day in a zodiac month, in order.
+
+    Equivalent to calling zodiac_to_gregorian for days 1..month_length,
+    with a single ingress lookup.
+    """
+    length = month_length(zodiac_year, month)
+    start_ord = _get_ingress_ordinals_for_zodiac_year(zodiac_year)[0][month - 1]
+    return [date.fromordinal(start_ord + i) for i in range(length)]
+
+
+def gregorian_range_to_zodiac(start: date, end: date) -> list[ZodiacDate]:
+    """Convert every Gregorian date in [start, end) to a Zodiac date.
+
+    Equivalent to calling gregorian_to_zodiac for each day, but only the
+    first day is looked up; the rest are counted forward month by month.
+    """
+    if start >= end:
+        return []
+
+    first = gregorian_to_zodiac(start)
+    year, month, day = first.year, first.month, first.day
+    length = month_length(year, month)
+
+    result = []
+    for _ in range(end.toordinal() - start.toordinal()):
+        result.append(ZodiacDate(year=year, month=month, day=day))
+        day += 1
+        if day > length:
+            day = 1
+            month += 1
+            if month > 12:
+                month = 1
+                year += 1
+            length = month_length(year, month)
+    return result
 
 
 def year_length(zodiac_year: int) -> int:
     """Get the total number of days in a zodiac year."""
-    return sum(month_length(zodiac_year, m) for m in range(1, 13))
+    start_ord = _get_ingress_ordinals_for_zodiac_year(zodiac_year)[0][0]
+    end_ord = _get_ingress_ordinals_for_zodiac_year(zodiac_year + 1)[0][0]
+    return end_ord - start_ord
@@ -1,36 +1,76 @@
 """Astronomical calculations for zodiac calendar using Skyfield."""
 
+import ast
+import atexit
 import json
 import os
-from datetime import datetime, timezone
+import sys
+import zipfile
+from array import array
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-from skyfield.api import load
-from skyfield.framelib import ecliptic_frame
-from skyfield import almanac
-
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 CACHE_FILE = DATA_DIR / "ingress_cache.json"
-
-# Lazy-loaded globals
+# Binary companion of the JSON cache: years[i] and ordinals[i, m], the UTC
+# date ordinal of sign m's ingress in that year
+BINARY_CACHE_FILE = CACHE_FILE.with_suffix(".npz")
+
+# JPL ephemeris to load. Only Sun and Earth are used, so AMARETH_EPHEM can
+# point at a much smaller excerpt of de440s.bsp (see README).
+EPHEMERIS_FILE = os.environ.get("AMARETH_EPHEM", "de440s.bsp")
+
+# Secant refinement of ingress times: stop once every step is below ~1 ms,
+# then require the result to sit on the sign boundary (~1e-6 deg ~ 0.1 s)
+_SECANT_TOLERANCE_DAYS = 1e-8
+_SECANT_TOLERANCE_DEGREES = 1e-6
+_SECANT_MAX_ITERATIONS = 10
+
+# Lazy-loaded globals. Skyfield and NumPy are imported only where ingresses
+# are computed or saved, so lookups served from the cache never pay their
+# import cost.
 _ts = None
 _eph = None
 _earth = None
 _sun = None
+_ecliptic_frame = None
+_cache = None
+_binary_cache = None
+_save_at_exit = False
+
+# Callbacks run after every save_ingress_cache, so memoized lookups built on
+# the old table (e.g. in core.converter) can be dropped
+_save_hooks = []
+
+
+def add_cache_save_hook(callback) -> None:
+    """Call `callback()` each time the ingress cache is saved."""
+    _save_hooks.append(callback)
 
 
 def _init_skyfield():
     """Initialize Skyfield objects (lazy, cached)."""
-    global _ts, _eph, _earth, _sun
+    global _ts, _eph, _earth, _sun, _ecliptic_frame
     if _ts is None:
+        from skyfield.api import load
+        from skyfield.framelib import ecliptic_frame
+
+        _ecliptic_frame = ecliptic_frame
         _ts = load.timescale()
-        _eph = load("de440s.bsp")
+        _eph = load(EPHEMERIS_FILE)
         _earth = _eph["earth"]
         _sun = _eph["sun"]
 
 
+def _sun_longitude_degrees(t):
+    """Sun's apparent ecliptic longitude in degrees for a (scalar or array) Time."""
+    astrometric = _earth.at(t).observe(_sun).apparent()
+    _, lon, _ = astrometric.frame_latlon(_ecliptic_frame)
+    return lon.degrees % 360
+
+
 def sun_longitude_at(dt: datetime) -> float:
     """Get the Sun's ecliptic longitude in degrees at a given UTC datetime.
 
@@ -38,9 +78,7 @@ def sun_longitude_at(dt: datetime) -> float:
     """
     _init_skyfield()
     t = _ts.from_datetime(dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt)
-    astrometric = _earth.at(t).observe(_sun).apparent()
-    _, lon, _ = astrometric.frame_latlon(ecliptic_frame)
-    return lon.degrees % 360
+    return float(_sun_longitude_degrees(t))
 
 
 def compute_ingresses(year: int) -> list[dict]:
@@ -50,35 +88,51 @@ def compute_ingresses(year: int) -> list[dict]:
     Returns a list of 12 dicts with keys: sign_index, longitude, utc_iso, utc_datetime.
     The list covers from the Aries ingress of `year` through Pisces.
     """
-    _init_skyfield()
-
-    def zodiac_sign_at(t):
-        e = _earth.at(t)
-        _, slon, _ = e.observe(_sun).apparent().frame_latlon(ecliptic_frame)
-        return (slon.degrees // 30).astype(int) % 12
+    import numpy as np
 
-    zodiac_sign_at.step_days = 25
+    _init_skyfield()
 
-    # Search from Feb 1 of the given year to Apr 1 of the next year
-    # to capture all 12 ingresses of one zodiac year
-    t0 = _ts.utc(year, 2, 1)
-    t1 = _ts.utc(year + 1, 4, 1)
+    # Evaluate the Sun's sign on a half-day grid from Mar 15 of the given year
+    # to ~Mar 25 of the next year. The Aries ingress falls on Mar 19-21, so the
+    # first sign change is always Aries and the first 12 cover the zodiac year.
+    grid = _ts.utc(year, 3, np.arange(15, 390, 0.5))
+    grid_lon = _sun_longitude_degrees(grid)
+    signs = (grid_lon // 30).astype(int) % 12
+
+    # Each sign change is bracketed by two neighbouring grid points. Refine
+    # all brackets at once with secant steps on the signed offset from the
+    # sign boundary; longitude is nearly linear over half a day, so a few
+    # batched evaluations reach millisecond precision.
+    idx = np.flatnonzero(np.diff(signs))[:12]
+    crossed = signs[idx + 1]
+    if crossed[0] != 0:
+        raise ValueError(f"First ingress after Mar 15, {year} is sign {crossed[0]}, expected Aries")
+    boundary = crossed * 30.0
+
+    def offset(lon):
+        return (lon - boundary + 180) % 360 - 180
+
+    lo, hi = grid.tt[idx], grid.tt[idx + 1]
+    t0, f0 = lo, offset(grid_lon[idx])
+    t1, f1 = hi, offset(grid_lon[idx + 1])
+    for _ in range(_SECANT_MAX_ITERATIONS):
+        slope = f1 - f0
+        step = np.divide(f1 * (t1 - t0), slope, out=np.zeros_like(t1), where=slope != 0)
+        # Never leave the grid bracket that holds the sign change
+        t0, f0 = t1, f1
+        t1 = np.clip(t1 - step, lo, hi)
+        f1 = offset(_sun_longitude_degrees(_ts.tt_jd(t1)))
+        if np.all(np.abs(t1 - t0) < _SECANT_TOLERANCE_DAYS):
+            break
+    else:
+        raise ValueError(f"Ingress search for {year} did not converge")
 
-    times, signs = almanac.find_discrete(t0, t1, zodiac_sign_at)
+    if not np.all(np.abs(f1) < _SECANT_TOLERANCE_DEGREES):
+        raise ValueError(f"Ingress search for {year} ended off the sign boundary")
 
     ingresses = []
-    seen_aries = False
-
-    for t, sign_index in zip(times, signs):
+    for t, sign_index in zip(_ts.tt_jd(t1), crossed):
         sign_index = int(sign_index)
-
-        # Start collecting from Aries (sign 0)
-        if sign_index == 0 and not seen_aries:
-            seen_aries = True
-
-        if not seen_aries:
-            continue
-
         dt = t.utc_datetime()
         ingresses.append({
             "sign_index": sign_index,
@@ -87,74 +141,189 @@ def compute_ingresses(year: int) -> list[dict]:
             "utc_datetime": dt,
         })
 
-        # Stop after collecting all 12 signs
-        if len(ingresses) == 12:
-            break
-
     return ingresses
 
 
-def compute_ingresses_range(start_year: int, end_year: int) -> dict:
+def _serializable(ing: dict) -> dict:
+    """Strip an ingress entry down to the fields stored in the JSON cache."""
+    return {
+        "sign_index": ing["sign_index"],
+        "longitude": ing["longitude"],
+        "utc_iso": ing["utc_iso"],
+    }
+
+
+def _attach_dates(entries: list[dict]) -> None:
+    """Precompute each entry's UTC calendar date from the YYYY-MM-DD prefix."""
+    for entry in entries:
+        entry["_date"] = date.fromisoformat(entry["utc_iso"][:10])
+
+
+def _compute_serializable_ingresses(year: int) -> list[dict]:
+    """Compute one year's ingresses as JSON-ready entries (process pool worker)."""
+    return [_serializable(ing) for ing in compute_ingresses(year)]
+
+
+def compute_ingresses_range(start_year: int, end_year: int, max_workers: Optional[int] = None) -> dict:
     """Compute ingress tables for a range of years.
 
     Returns a dict keyed by year, each containing a list of 12 ingress entries.
     The utc_datetime field is excluded (not JSON-serializable).
+    Years are computed in parallel worker processes (one per CPU by default).
     """
-    result = {}
-    for year in range(start_year, end_year + 1):
-        ingresses = compute_ingresses(year)
-        result[str(year)] = [
-            {
-                "sign_index": ing["sign_index"],
-                "longitude": ing["longitude"],
-                "utc_iso": ing["utc_iso"],
-            }
-            for ing in ingresses
-        ]
-    return result
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Load (and if needed download) the ephemeris once before the workers
+    # start, so they don't race to fetch the same file
+    _init_skyfield()
+
+    years = range(start_year, end_year + 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_compute_serializable_ingresses, years)
+        return {str(year): entries for year, entries in zip(years, results)}
 
 
 def load_ingress_cache() -> Optional[dict]:
-    """Load pre-computed ingress cache from JSON file."""
-    if not CACHE_FILE.exists():
-        return None
-    with open(CACHE_FILE) as f:
-        return json.load(f)
+    """Load pre-computed ingress cache from JSON file.
+
+    The file is parsed once per process; later calls return the same dict.
+    Each entry also carries a precomputed `_date` (UTC date of the ingress).
+    """
+    global _cache
+    if _cache is None:
+        if not CACHE_FILE.exists():
+            return None
+        with open(CACHE_FILE) as f:
+            _cache = json.load(f)
+        for entries in _cache.values():
+            _attach_dates(entries)
+    return _cache
+
+
+def _read_npy_int32(raw: bytes) -> tuple[tuple[int, ...], array]:
+    """Decode a little-endian int32 .npy payload without importing NumPy.
+
+    Returns (shape, flat values). Only the layout np.savez writes for the
+    binary cache is supported.
+    """
+    if raw[:6] != b"\x93NUMPY":
+        raise ValueError("Not an .npy array")
+    if raw[6] == 1:
+        header_start, header_len = 10, int.from_bytes(raw[8:10], "little")
+    else:
+        header_start, header_len = 12, int.from_bytes(raw[8:12], "little")
+    header = ast.literal_eval(raw[header_start:header_start + header_len].decode("latin1"))
+    values = array("i")
+    if header["descr"] != "<i4" or header["fortran_order"] or values.itemsize != 4:
+        raise ValueError(f"Unsupported .npy layout: {header}")
+    values.frombytes(raw[header_start + header_len:])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return header["shape"], values
+
+
+def load_binary_ingress_cache() -> Optional[tuple[list[int], list[tuple[int, ...]]]]:
+    """Load the binary ingress date table as (years, per-year ordinal tuples)."""
+    global _binary_cache
+    if _binary_cache is None:
+        if not BINARY_CACHE_FILE.exists():
+            return None
+        with zipfile.ZipFile(BINARY_CACHE_FILE) as zf:
+            _, years = _read_npy_int32(zf.read("years.npy"))
+            (n_years, n_signs), ordinals = _read_npy_int32(zf.read("ordinals.npy"))
+        _binary_cache = (
+            years.tolist(),
+            [tuple(ordinals[i * n_signs:(i + 1) * n_signs]) for i in range(n_years)],
+        )
+    return _binary_cache
 
 
 def save_ingress_cache(data: dict) -> None:
-    """Save ingress cache to JSON file."""
+    """Save ingress cache to JSON file and its binary date table."""
+    import numpy as np
+
+    global _cache, _binary_cache
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+    serializable = {
+        year_str: [_serializable(entry) for entry in entries]
+        for year_str, entries in data.items()
+    }
     with open(CACHE_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+        json.dump(serializable, f, indent=2)
 
+    years = sorted(int(year_str) for year_str in serializable)
+    ordinals = [
+        [date.fromisoformat(entry["utc_iso"][:10]).toordinal() for entry in serializable[str(year)]]
+        for year in years
+    ]
+    np.savez(
+        BINARY_CACHE_FILE,
+        years=np.array(years, dtype=np.int32),
+        ordinals=np.array(ordinals, dtype=np.int32),
+    )
+    _cache = None
+    _binary_cache = None
+    for hook in _save_hooks:
+        hook()
 
-def get_ingresses_for_year(year: int) -> list[dict]:
-    """Get ingresses for a year, using cache if available, computing otherwise."""
+
+def _save_runtime_ingresses() -> None:
+    """Persist years computed on cache misses (registered with atexit)."""
+    if _cache is not None:
+        save_ingress_cache(_cache)
+
+
+def _get_cached_entries(year: int) -> list[dict]:
+    """Get the raw cache entries for a year, computing them on a miss.
+
+    Computed years are added to the in-memory cache and written to disk once,
+    at process exit, rather than rewriting the whole file on every miss.
+    """
+    global _cache, _save_at_exit
     cache = load_ingress_cache()
     year_str = str(year)
 
     if cache and year_str in cache:
-        entries = cache[year_str]
-        # Parse ISO dates back to datetime objects
-        for entry in entries:
-            entry["utc_datetime"] = datetime.fromisoformat(entry["utc_iso"])
-        return entries
-
-    # Compute and optionally update cache
-    ingresses = compute_ingresses(year)
-    serializable = [
-        {
-            "sign_index": ing["sign_index"],
-            "longitude": ing["longitude"],
-            "utc_iso": ing["utc_iso"],
-        }
-        for ing in ingresses
-    ]
+        return cache[year_str]
+
+    # Compute and update cache
+    entries = [_serializable(ing) for ing in compute_ingresses(year)]
+    _attach_dates(entries)
 
     if cache is None:
-        cache = {}
-    cache[year_str] = serializable
-    save_ingress_cache(cache)
+        cache = _cache = {}
+    cache[year_str] = entries
 
-    return ingresses
+    if not _save_at_exit:
+        atexit.register(_save_runtime_ingresses)
+        _save_at_exit = True
+
+    return entries
+
+
+def get_ingresses_for_year(year: int) -> list[dict]:
+    """Get ingresses for a year, using cache if available, computing otherwise."""
+    return [
+        dict(_serializable(entry), utc_datetime=datetime.fromisoformat(entry["utc_iso"]))
+        for entry in _get_cached_entries(year)
+    ]
+
+
+def get_ingress_ordinals_for_year(year: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Get (UTC date ordinals, sign indices) for a year without parsing full timestamps.
+
+    Ordinals are `date.toordinal()` values, so day offsets are plain int math.
+    Both tuples have 12 items in ingress order.
+    """
+    binary = load_binary_ingress_cache()
+    if binary is not None:
+        years, ordinals = binary
+        i = year - years[0]
+        if 0 <= i < len(years) and years[i] == year:
+            return ordinals[i], tuple(range(len(ordinals[i])))
+
+    entries = _get_cached_entries(year)
+    return (
+        tuple(entry["_date"].toordinal() for entry in entries),
+        tuple(entry["sign_index"] for entry in entries),
+    )
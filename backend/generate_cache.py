@@ -12,13 +12,16 @@ def main():
     parser = argparse.ArgumentParser(description="Generate ingress cache for zodiac calendar")
     parser.add_argument("--start", type=int, default=2000, help="Start year (default: 2000)")
     parser.add_argument("--end", type=int, default=2100, help="End year (default: 2100)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     print(f"Computing ingress dates for {args.start}-{args.end}...")
     print("(This downloads ephemeris data on first run and may take a minute)")
 
     start_time = time.time()
-    data = compute_ingresses_range(args.start, args.end)
+    data = compute_ingresses_range(args.start, args.end, max_workers=args.workers)
     elapsed = time.time() - start_time
 
     save_ingress_cache(data)
@@ -26,7 +29,7 @@ def main():
     total_entries = sum(len(v) for v in data.values())
     print(f"Done! {len(data)} years, {total_entries} ingress entries")
     print(f"Time: {elapsed:.1f}s")
-    print(f"Saved to data/ingress_cache.json")
+    print(f"Saved to data/ingress_cache.json and data/ingress_cache.npz")
 
 
 if __name__ == "__main__":
@@ -10,7 +10,9 @@ from datetime import date, timedelta
 from core.calendar import ZodiacDate, ZODIAC_SIGNS
 from core.converter import (
     gregorian_to_zodiac,
+    gregorian_range_to_zodiac,
     zodiac_to_gregorian,
+    month_days,
     month_length,
     year_length,
     _get_ingress_dates_for_zodiac_year,
@@ -208,6 +210,28 @@ class TestContinuousCoverage:
             current += timedelta(days=1)
 
 
+class TestBulkConversion:
+    """Bulk helpers should agree with the per-day conversions."""
+
+    @pytest.mark.parametrize("month_num", [1, 6, 12])
+    def test_month_days_match_zodiac_to_gregorian(self, month_num):
+        days = month_days(2026, month_num)
+        assert len(days) == month_length(2026, month_num)
+        for day, greg in enumerate(days, start=1):
+            assert greg == zodiac_to_gregorian(ZodiacDate(2026, month_num, day))
+
+    def test_range_matches_gregorian_to_zodiac_across_year_boundary(self):
+        start = date(2026, 1, 1)
+        end = date(2027, 4, 1)
+        zds = gregorian_range_to_zodiac(start, end)
+        assert len(zds) == (end - start).days
+        for i, zd in enumerate(zds):
+            assert zd == gregorian_to_zodiac(start + timedelta(days=i))
+
+    def test_empty_range(self):
+        assert gregorian_range_to_zodiac(date(2026, 5, 1), date(2026, 5, 1)) == []
+
+
 class TestEdgeCases:
     """Invalid inputs and boundary conditions."""
 
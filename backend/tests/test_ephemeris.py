@@ -0,0 +1,90 @@
+"""Tests for the solar ingress search in core.ephemeris.
+
+Most tests swap Skyfield's apparent-place pipeline for an analytic
+mean-Sun model, so the grid + secant search runs offline. The final test
+checks the real search against the shipped cache when de440s.bsp is
+available locally.
+"""
+
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from skyfield.api import load
+
+from core import ephemeris
+from core.ephemeris import compute_ingresses, load_ingress_cache
+
+
+def _model_longitude(t):
+    """Mean Sun plus equation of centre (~0.01 deg), in degrees [0, 360)."""
+    d = np.asarray(t.tt) - 2451545.0
+    g = np.radians(357.529 + 0.98560028 * d)
+    q = 280.459 + 0.98564736 * d
+    return (q + 1.915 * np.sin(g) + 0.020 * np.sin(2 * g)) % 360
+
+
+def _boundary_offset(lon, sign_index):
+    """Signed distance in degrees from a longitude to its sign's start."""
+    return (lon - sign_index * 30 + 180) % 360 - 180
+
+
+@pytest.fixture
+def model_sun(monkeypatch):
+    """Run compute_ingresses against the analytic model instead of Skyfield."""
+    monkeypatch.setattr(ephemeris, "_init_skyfield", lambda: None)
+    monkeypatch.setattr(ephemeris, "_ts", load.timescale(builtin=True))
+    monkeypatch.setattr(ephemeris, "_sun_longitude_degrees", _model_longitude)
+    return ephemeris._ts
+
+
+class TestComputeIngressesModel:
+    """The search should find all 12 sign crossings of the model Sun."""
+
+    @pytest.mark.parametrize("year", [1900, 2026, 2100])
+    def test_twelve_signs_in_order(self, model_sun, year):
+        ingresses = compute_ingresses(year)
+        assert [ing["sign_index"] for ing in ingresses] == list(range(12))
+        assert [ing["longitude"] for ing in ingresses] == list(range(0, 360, 30))
+
+        times = [ing["utc_datetime"] for ing in ingresses]
+        assert all(a < b for a, b in zip(times, times[1:]))
+
+        aries = times[0]
+        assert (aries.year, aries.month) == (year, 3)
+        assert 19 <= aries.day <= 21
+
+    @pytest.mark.parametrize("year", [1900, 2026, 2100])
+    def test_results_sit_on_sign_boundaries(self, model_sun, year):
+        for ing in compute_ingresses(year):
+            assert datetime.fromisoformat(ing["utc_iso"]) == ing["utc_datetime"]
+            lon = _model_longitude(model_sun.from_datetime(ing["utc_datetime"]))
+            offset = _boundary_offset(lon, ing["sign_index"])
+            assert abs(offset) < ephemeris._SECANT_TOLERANCE_DEGREES
+
+    def test_first_crossing_not_aries_raises(self, model_sun, monkeypatch):
+        # Shift the model 40 deg ahead: the first crossing after Mar 15 is Taurus
+        monkeypatch.setattr(
+            ephemeris, "_sun_longitude_degrees", lambda t: (_model_longitude(t) + 40) % 360
+        )
+        with pytest.raises(ValueError, match="expected Aries"):
+            compute_ingresses(2026)
+
+    def test_no_convergence_raises(self, model_sun, monkeypatch):
+        monkeypatch.setattr(ephemeris, "_SECANT_MAX_ITERATIONS", 1)
+        with pytest.raises(ValueError, match="did not converge"):
+            compute_ingresses(2026)
+
+
+@pytest.mark.skipif(
+    not Path(ephemeris.EPHEMERIS_FILE).exists(),
+    reason=f"{ephemeris.EPHEMERIS_FILE} not available locally",
+)
+def test_matches_shipped_cache():
+    """The apparent-place search should reproduce data/ingress_cache.json."""
+    cached = load_ingress_cache()["2026"]
+    for ing, entry in zip(compute_ingresses(2026), cached, strict=True):
+        assert ing["sign_index"] == entry["sign_index"]
+        delta = ing["utc_datetime"] - datetime.fromisoformat(entry["utc_iso"])
+        assert abs(delta.total_seconds()) < 1.0, f"Sign {ing['sign_index']} off by {delta}"
@@ -0,0 +1,147 @@
+"""Tests for the ingress cache files and their lookup paths.
+
+The binary .npz table answers date lookups in place of the JSON cache, so
+both must agree, and years missing from the table must still resolve
+through the JSON entries. Years computed on a miss are written once, at exit.
+"""
+
+import json
+
+import pytest
+from datetime import date, datetime, timedelta, timezone
+
+from core import converter, ephemeris
+from core.ephemeris import (
+    get_ingress_ordinals_for_year,
+    load_binary_ingress_cache,
+    load_ingress_cache,
+)
+
+
+def _fake_ingresses(year):
+    """Stand-in for compute_ingresses: 12 signs, 30 days apart from Mar 20."""
+    start = datetime(year, 3, 20, 12, tzinfo=timezone.utc)
+    result = []
+    for i in range(12):
+        dt = start + timedelta(days=30 * i)
+        result.append({"sign_index": i, "longitude": i * 30, "utc_iso": dt.isoformat(), "utc_datetime": dt})
+    return result
+
+
+def _json_ordinals(year):
+    """(ordinals, sign indices) for a year, straight from the JSON utc_iso strings."""
+    entries = load_ingress_cache()[str(year)]
+    return (
+        tuple(date.fromisoformat(e["utc_iso"][:10]).toordinal() for e in entries),
+        tuple(e["sign_index"] for e in entries),
+    )
+
+
+class TestBinaryCacheMatchesJson:
+    """Every year in the .npz should match the JSON cache exactly."""
+
+    def test_same_years(self):
+        years, _ = load_binary_ingress_cache()
+        assert years == sorted(int(y) for y in load_ingress_cache())
+
+    def test_ordinals_and_signs_match(self):
+        years, _ = load_binary_ingress_cache()
+        for year in years:
+            assert get_ingress_ordinals_for_year(year) == _json_ordinals(year), f"Mismatch in {year}"
+
+
+class TestJsonFallback:
+    """Years absent from the binary table are served from the JSON entries."""
+
+    def test_year_missing_from_binary_table(self, monkeypatch):
+        years, ordinals = load_binary_ingress_cache()
+        i = years.index(2026)
+        monkeypatch.setattr(ephemeris, "_binary_cache", (years[:i], ordinals[:i]))
+        assert get_ingress_ordinals_for_year(2026) == _json_ordinals(2026)
+
+    @pytest.mark.parametrize("year", [2026, 2030])
+    def test_non_contiguous_binary_table(self, monkeypatch, year):
+        # As written after runtime misses, e.g. [2024, 2025, 2030]
+        years, ordinals = load_binary_ingress_cache()
+        keep = [years.index(y) for y in (2024, 2025, 2030)]
+        monkeypatch.setattr(
+            ephemeris,
+            "_binary_cache",
+            ([years[k] for k in keep], [ordinals[k] for k in keep]),
+        )
+        assert get_ingress_ordinals_for_year(year) == _json_ordinals(year)
+
+    def test_no_binary_table(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(ephemeris, "_binary_cache", None)
+        monkeypatch.setattr(ephemeris, "BINARY_CACHE_FILE", tmp_path / "missing.npz")
+        assert get_ingress_ordinals_for_year(2026) == _json_ordinals(2026)
+
+
+class TestRuntimeMisses:
+    """Years computed on a cache miss are kept in memory and saved once at exit."""
+
+    def test_misses_saved_once_by_exit_hook(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(ephemeris, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(ephemeris, "CACHE_FILE", tmp_path / "ingress_cache.json")
+        monkeypatch.setattr(ephemeris, "BINARY_CACHE_FILE", tmp_path / "ingress_cache.npz")
+        monkeypatch.setattr(ephemeris, "_cache", None)
+        monkeypatch.setattr(ephemeris, "_binary_cache", None)
+        monkeypatch.setattr(ephemeris, "_save_at_exit", False)
+        monkeypatch.setattr(ephemeris, "compute_ingresses", _fake_ingresses)
+        registered = []
+        monkeypatch.setattr(ephemeris.atexit, "register", registered.append)
+
+        expected = {
+            year: tuple(date(year, 3, 20).toordinal() + 30 * i for i in range(12))
+            for year in (2050, 2059)
+        }
+        for year in expected:
+            assert get_ingress_ordinals_for_year(year) == (expected[year], tuple(range(12)))
+
+        # Nothing is written until the exit hook runs, and it is registered once
+        assert list(tmp_path.iterdir()) == []
+        assert registered == [ephemeris._save_runtime_ingresses]
+
+        ephemeris._save_runtime_ingresses()
+
+        with open(tmp_path / "ingress_cache.json") as f:
+            assert sorted(json.load(f)) == ["2050", "2059"]
+        years, ordinals = load_binary_ingress_cache()
+        assert years == [2050, 2059]
+        assert ordinals == [expected[2050], expected[2059]]
+
+        # The saved table is non-contiguous; 2059 still resolves via the JSON
+        for year in expected:
+            assert get_ingress_ordinals_for_year(year) == (expected[year], tuple(range(12)))
+
+
+class TestSaveInvalidatesConverter:
+    """Saving a new table must not leave stale memoized converter lookups."""
+
+    @pytest.fixture
+    def tmp_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(ephemeris, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(ephemeris, "CACHE_FILE", tmp_path / "ingress_cache.json")
+        monkeypatch.setattr(ephemeris, "BINARY_CACHE_FILE", tmp_path / "ingress_cache.npz")
+        monkeypatch.setattr(ephemeris, "_cache", None)
+        monkeypatch.setattr(ephemeris, "_binary_cache", None)
+        converter._get_ingress_ordinals_for_zodiac_year.cache_clear()
+        converter._get_ingress_dates_for_zodiac_year.cache_clear()
+        yield
+        # Leave no tmp_path data memoized for later tests
+        converter._get_ingress_ordinals_for_zodiac_year.cache_clear()
+        converter._get_ingress_dates_for_zodiac_year.cache_clear()
+
+    def test_converter_sees_saved_table(self, tmp_cache):
+        ephemeris.save_ingress_cache({"2026": _fake_ingresses(2026)})
+        assert converter._get_ingress_dates_for_zodiac_year(2026)[0][0] == date(2026, 3, 20)
+        assert converter.gregorian_to_zodiac(date(2026, 3, 20)).month == 1
+
+        # Move the Aries ingress one day later and save again
+        shifted = _fake_ingresses(2026)
+        shifted[0]["utc_iso"] = shifted[0]["utc_datetime"].replace(day=21).isoformat()
+        ephemeris.save_ingress_cache({"2026": shifted})
+
+        assert converter._get_ingress_dates_for_zodiac_year(2026)[0][0] == date(2026, 3, 21)
+        zd = converter.gregorian_to_zodiac(date(2026, 3, 21))
+        assert (zd.year, zd.month, zd.day) == (2026, 1, 1)